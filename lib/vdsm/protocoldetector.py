@@ -61,6 +61,7 @@ class _AcceptorImpl(object):
         self.log.info("Accepted connection from %s:%d", addr[0], addr[1])
         try:
             client.setblocking(0)
+            client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self._dispatcher_factory(client)
         except socket.error:
             self.log.exception("Error creating dispatcher for %s:%d",
@@ -377,8 +377,10 @@ class ProgressCommand(object):
         # qemu-img updates progress by printing \r (0.00/100%) to standard out.
         # The output could end with a partial progress so we must discard
         # everything after the last \r and then try to parse a progress record.
-        valid_progress = out[:idx]
-        last_progress = valid_progress.rsplit(b'\r', 1)[-1]
+        # Only the last complete record is copied; searching backwards for the
+        # previous \r avoids copying and splitting the entire buffer.
+        start = out.rfind(b'\r', 0, idx) + 1
+        last_progress = out[start:idx]
 
         # No need to keep old progress information around
         del out[:idx + 1]
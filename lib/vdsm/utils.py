@@ -376,6 +376,10 @@ def create_connected_socket(host, port, sslctx=None, timeout=None):
     family, socktype, proto, _, _ = addrinfo[0]
     sock = socket.socket(family, socktype, proto)
 
+    # Our clients send small request frames and wait for the reply; disable
+    # Nagle's algorithm so these frames are not delayed by the kernel.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
     if sslctx:
         sock = sslctx.wrapSocket(sock)
 
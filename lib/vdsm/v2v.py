@@ -231,12 +231,12 @@ def get_ova_info(ova_path):
 
     ovf_str = _read_ovf_from_ova(ova_path)
     try:
-        root = ET.fromstring(ovf_str)
+        root, ns_map = _parse_ovf(ovf_str)
     except ET.ParseError as e:
         raise V2VError('Error reading ovf from ova, position: %r' % e.position)
 
     vm = {}
-    _add_origin_ovf_info(vm, root, ovf_str)
+    _add_origin_ovf_info(vm, ns_map)
     _add_general_ovf_info(vm, root, ns, ova_path)
     _add_disks_ovf_info(vm, root, ns)
     _add_networks_ovf_info(vm, root, ns)
@@ -1108,24 +1108,24 @@ def _add_vm_info(vm, params):
         params['status'] = "Down"
 
 
-def _extract_ns_map(xml_str):
-    # there is no easy way to extract the detected namespaces from ET,
-    # so the only reliable option is parse the XML twice. Ugh.
-    try:
-        xml_str = xml_str.decode('utf-8')
-    except AttributeError:
-        pass  # already unicode
-    xml_src = io.StringIO(xml_str)
-    events = ("start-ns",)
-    return {
-        name: uri
-        for event, (name, uri) in ET.iterparse(xml_src, events)
-        if event == "start-ns"
-    }
-
-
-def _add_origin_ovf_info(vm, root, ovf_str):
-    ns_map = _extract_ns_map(ovf_str)
+def _parse_ovf(xml_str):
+    """
+    Parse xml_str in a single pass, returning the root element and a dict
+    mapping the namespace prefixes declared in the document to their URIs.
+    """
+    # ET.fromstring() drops the declared namespaces, but iterparse() builds
+    # the same tree while reporting them. Bytes are passed as is, so expat
+    # handles the document encoding and reports bad input as ParseError.
+    if isinstance(xml_str, bytes):
+        xml_src = io.BytesIO(xml_str)
+    else:
+        xml_src = io.StringIO(xml_str)
+    parser = ET.iterparse(xml_src, ("start-ns",))
+    ns_map = {name: uri for event, (name, uri) in parser}
+    return parser.root, ns_map
+
+
+def _add_origin_ovf_info(vm, ns_map):
     if 'ovirt' in ns_map:
         vm['originType'] = _OVF_ORIGIN_OVIRT
 
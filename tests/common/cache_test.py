@@ -35,6 +35,10 @@ class TestMemoized(TestCaseBase):
     def setUp(self):
         self.values = {}
         self.accessed = collections.defaultdict(int)
+        # The caches live on the class and the module, and would otherwise
+        # keep entries (and test instances) from previous tests.
+        self.memoized_method.invalidate()
+        memoized_function.invalidate()
 
     @permutations([[()], [("a",)], [("a", "b")]])
     def test_memoized_method(self, args):
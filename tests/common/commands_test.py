@@ -173,12 +173,9 @@ class TestRun:
         assert e.value.err == b"err"
 
     def test_setsid(self):
-        args = [sys.executable, '-c',
-                'from __future__ import print_function;'
-                'import os;'
-                'print(os.getsid(os.getpid()))']
-        out = commands.run(args, setsid=True)
-        assert int(out) != os.getsid(os.getpid())
+        # Field 6 of /proc/pid/stat is the session id.
+        out = commands.run(["cat", "/proc/self/stat"], setsid=True)
+        assert int(out.split()[5]) != os.getsid(os.getpid())
 
     def test_ioclass(self):
         out = commands.run(
@@ -255,11 +252,9 @@ class TestExecCmd:
 
     @pytest.mark.parametrize("cmd", CMD_TYPES)
     def test_set_sid(self, cmd):
-        cmd_args = (sys.executable, '-c',
-                    'from __future__ import print_function;import os;'
-                    'print(os.getsid(os.getpid()))')
-        rc, out, _ = commands.execCmd(cmd(cmd_args), setsid=True)
-        assert int(out[0]) != os.getsid(os.getpid())
+        rc, out, _ = commands.execCmd(cmd(('cat', '/proc/self/stat')),
+                                      setsid=True)
+        assert int(out[0].split()[5]) != os.getsid(os.getpid())
 
     @pytest.mark.parametrize("cmd", CMD_TYPES)
     @pytest.mark.skipif(os.getuid() != 0, reason="Requires root")
@@ -278,6 +273,7 @@ class TestExecCmdStress:
     FUNC_CALLS = 40
     BLOCK_SIZE = 4096
     BLOCK_COUNT = 256
+    DATA = b'x' * BLOCK_SIZE * BLOCK_COUNT
 
     def setup_method(self, test_method):
         self.data = None  # Written to process stdin
@@ -294,7 +290,7 @@ class TestExecCmdStress:
 
     @pytest.mark.stress
     def test_write_stdin_read_stderr(self):
-        self.data = 'x' * self.BLOCK_SIZE * self.BLOCK_COUNT
+        self.data = self.DATA
         self.check(self.write_stdin_read_stderr)
 
     def check(self, func):
@@ -21,8 +21,7 @@
 from __future__ import absolute_import
 from __future__ import division
 
-import time
-
+from vdsm.common import function
 from vdsm.common import proc
 from vdsm.common.compat import subprocess
 
@@ -55,12 +54,15 @@ class TestPgrep(TestCaseBase):
                 popen = subprocess.Popen([EXT_SLEEP, "3"])
                 sleepProcs.append(popen)
             # There is no guarantee which process run first after forking a
-            # child process, make sure all the children are runing before we
-            # look for them.
-            time.sleep(0.5)
-            pids = proc.pgrep(EXT_SLEEP)
-            for popen in sleepProcs:
-                self.assertIn(popen.pid, pids)
+            # child process, retry until all the children are running instead
+            # of sleeping for a fixed time.
+
+            def check():
+                pids = proc.pgrep(EXT_SLEEP)
+                for popen in sleepProcs:
+                    self.assertIn(popen.pid, pids)
+
+            function.retry(check, AssertionError, timeout=2, sleep=0.05)
         finally:
             for popen in sleepProcs:
                 popen.kill()
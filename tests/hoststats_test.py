@@ -52,25 +52,31 @@ procs_blocked 0
                                               'btime 22not_a_number3'}
     fixture_extra = proc_stat_template % {'btime_line': 'btime 1395249141 foo'}
 
-    def _createFixtureFile(self, name, content):
-        path = os.path.join(self._tmpDir, name)
+    @classmethod
+    def _createFixtureFile(cls, name, content):
+        path = os.path.join(cls._tmpDir, name)
         with open(path, 'w') as f:
             f.write(content)
         return path
 
-    def setUp(self):
-        self._tmpDir = tempfile.mkdtemp()
-        self._good_path = self._createFixtureFile('good',
-                                                  self.fixture_good)
-        self._missing_path = self._createFixtureFile('missing',
-                                                     self.fixture_missing)
-        self._malformed_path = self._createFixtureFile('malformed',
-                                                       self.fixture_malformed)
-        self._extra_path = self._createFixtureFile('extra',
-                                                   self.fixture_extra)
-
-    def tearDown(self):
-        shutil.rmtree(self._tmpDir)
+    @classmethod
+    def setUpClass(cls):
+        super(BootTimeTests, cls).setUpClass()
+        # The fixtures are never modified, so write them once for all tests.
+        cls._tmpDir = tempfile.mkdtemp()
+        cls._good_path = cls._createFixtureFile('good',
+                                                cls.fixture_good)
+        cls._missing_path = cls._createFixtureFile('missing',
+                                                   cls.fixture_missing)
+        cls._malformed_path = cls._createFixtureFile('malformed',
+                                                     cls.fixture_malformed)
+        cls._extra_path = cls._createFixtureFile('extra',
+                                                 cls.fixture_extra)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._tmpDir)
+        super(BootTimeTests, cls).tearDownClass()
 
     def testBootTimeOk(self):
         with MonkeyPatchScope([(hoststats, '_PROC_STAT_PATH',
@@ -0,0 +1,51 @@
+# Copyright 2019 Red Hat, Inc.
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301 USA
+#
+# Refer to the README and COPYING files for full details of the license
+
+from __future__ import absolute_import
+from __future__ import division
+
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'unit: network unit test (legacy nose attr type=unit)')
+    config.addinivalue_line(
+        'markers',
+        'integration: network integration test '
+        '(legacy nose attr type=integration)')
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Expose the legacy nose @attr(type=...) tags as pytest markers, so the
+    network tests can be selected with "pytest -m unit" or
+    "pytest -m integration" without loading the nose attrib plugin.
+    """
+    for item in items:
+        test_type = _nose_test_type(item)
+        if test_type:
+            item.add_marker(getattr(pytest.mark, test_type))
+
+
+def _nose_test_type(item):
+    for obj in (getattr(item, 'function', None), getattr(item, 'cls', None)):
+        test_type = getattr(obj, 'type', None)
+        if isinstance(test_type, str):
+            return test_type
+    return None
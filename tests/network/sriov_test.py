@@ -38,6 +38,9 @@ PCI1 = '0000.1234.1.1'
 PCI2 = '0000.1234.1.2'
 NUMVFS = 2
 
+# Existing VFs are removed by writing 0 before the new numvfs is written.
+_EXPECTED_WRITE = '0' + str(NUMVFS)
+
 
 @attr(type='unit')
 class TestSriov(VdsmTestCase):
@@ -94,7 +97,7 @@ class TestSriovNumVfs(VdsmTestCase):
         fd = _create_fd(mock_open)
         sriov.update_numvfs(PCI1, NUMVFS)
         _assert_open_was_called(mock_open)
-        self.assertEqual(fd.getvalue(), '0' + str(NUMVFS))
+        self.assertEqual(fd.getvalue(), _EXPECTED_WRITE)
 
     @mock.patch.object(sriov, 'get_all_vf_names', lambda pci: [DEV0, DEV1])
     def test_update_numvfs_2_to_0(self, mock_open):
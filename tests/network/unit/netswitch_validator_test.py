@@ -28,6 +28,14 @@ from vdsm.network.netswitch import validator
 
 class ValidationTests(unittest.TestCase):
 
+    def _assert_config_error(self, err_code, func, *args):
+        try:
+            func(*args)
+        except ne.ConfigNetworkError as e:
+            self.assertEqual(e.args[0], err_code)
+        else:
+            self.fail('ConfigNetworkError not raised')
+
     def test_adding_a_new_single_untagged_net(self):
         fake_running_bonds = {}
         fake_to_be_added_bonds = {}
@@ -59,21 +67,19 @@ class ValidationTests(unittest.TestCase):
         fake_running_bonds = {}
         fake_to_be_added_bonds = {}
         fake_kernel_nics = []
-        with self.assertRaises(ne.ConfigNetworkError) as e:
-            validator.validate_net_configuration(
-                'net1', {'nic': 'eth0', 'switch': 'ovs'},
-                fake_to_be_added_bonds, fake_running_bonds, fake_kernel_nics)
-        self.assertEqual(e.exception.args[0], ne.ERR_BAD_NIC)
+        self._assert_config_error(
+            ne.ERR_BAD_NIC, validator.validate_net_configuration,
+            'net1', {'nic': 'eth0', 'switch': 'ovs'},
+            fake_to_be_added_bonds, fake_running_bonds, fake_kernel_nics)
 
     def test_add_network_with_non_existing_bond(self):
         fake_running_bonds = {}
         fake_to_be_added_bonds = {}
         fake_kernel_nics = []
-        with self.assertRaises(ne.ConfigNetworkError) as e:
-            validator.validate_net_configuration(
-                'net1', {'bonding': 'bond1', 'switch': 'ovs'},
-                fake_to_be_added_bonds, fake_running_bonds, fake_kernel_nics)
-        self.assertEqual(e.exception.args[0], ne.ERR_BAD_BONDING)
+        self._assert_config_error(
+            ne.ERR_BAD_BONDING, validator.validate_net_configuration,
+            'net1', {'bonding': 'bond1', 'switch': 'ovs'},
+            fake_to_be_added_bonds, fake_running_bonds, fake_kernel_nics)
 
     def test_add_network_with_to_be_added_bond(self):
         fake_running_bonds = {}
@@ -97,10 +103,10 @@ class ValidationTests(unittest.TestCase):
         fake_kernel_nics = []
         nets = {}
         running_nets = {}
-        with self.assertRaises(ne.ConfigNetworkError):
-            validator.validate_bond_configuration(
-                'bond1', {'switch': 'ovs'}, nets, running_nets,
-                fake_kernel_nics)
+        self._assert_config_error(
+            ne.ERR_BAD_NIC, validator.validate_bond_configuration,
+            'bond1', {'switch': 'ovs'}, nets, running_nets,
+            fake_kernel_nics)
 
     def test_add_bond_with_one_slave(self):
         fake_kernel_nics = ['eth0']
@@ -133,19 +139,19 @@ class ValidationTests(unittest.TestCase):
         fake_kernel_nics = []
         nets = {}
         running_nets = {}
-        with self.assertRaises(ne.ConfigNetworkError):
-            validator.validate_bond_configuration(
-                'bond1', {'nics': ['eth0', 'eth1'], 'switch': 'ovs'},
-                nets, running_nets, fake_kernel_nics)
+        self._assert_config_error(
+            ne.ERR_BAD_NIC, validator.validate_bond_configuration,
+            'bond1', {'nics': ['eth0', 'eth1'], 'switch': 'ovs'},
+            nets, running_nets, fake_kernel_nics)
 
     def test_add_bond_with_dpdk(self):
         fake_kernel_nics = []
         nets = {}
         running_nets = {}
-        with self.assertRaises(ne.ConfigNetworkError):
-            validator.validate_bond_configuration(
-                'bond1', {'nics': ['eth0', 'dpdk0'], 'switch': 'ovs'},
-                nets, running_nets, fake_kernel_nics)
+        self._assert_config_error(
+            ne.ERR_BAD_NIC, validator.validate_bond_configuration,
+            'bond1', {'nics': ['eth0', 'dpdk0'], 'switch': 'ovs'},
+            nets, running_nets, fake_kernel_nics)
 
     def test_remove_bond_attached_to_a_network(self):
         fake_kernel_nics = ['eth0', 'eth1']
@@ -169,11 +175,10 @@ class ValidationTests(unittest.TestCase):
         fake_kernel_nics = ['eth0', 'eth1']
         nets = {}
         running_nets = {'net1': {'southbound': 'bond1'}}
-        with self.assertRaises(ne.ConfigNetworkError) as e:
-            validator.validate_bond_configuration(
-                'bond1', {'remove': True}, nets, running_nets,
-                fake_kernel_nics)
-        self.assertEqual(e.exception.args[0], ne.ERR_USED_BOND)
+        self._assert_config_error(
+            ne.ERR_USED_BOND, validator.validate_bond_configuration,
+            'bond1', {'remove': True}, nets, running_nets,
+            fake_kernel_nics)
 
     def test_remove_bond_attached_to_network_that_will_use_nic(self):
         fake_kernel_nics = ['eth0', 'eth1']
@@ -188,8 +193,7 @@ class ValidationTests(unittest.TestCase):
         fake_kernel_nics = ['eth0', 'eth1', 'eth2']
         nets = {'net1': {'nic': 'eth0'}, 'net2': {'bonding': 'bond1'}}
         running_nets = {'net1': {'southbound': 'bond1'}}
-        with self.assertRaises(ne.ConfigNetworkError) as e:
-            validator.validate_bond_configuration(
-                'bond1', {'remove': True}, nets, running_nets,
-                fake_kernel_nics)
-        self.assertEqual(e.exception.args[0], ne.ERR_USED_BOND)
+        self._assert_config_error(
+            ne.ERR_USED_BOND, validator.validate_bond_configuration,
+            'bond1', {'remove': True}, nets, running_nets,
+            fake_kernel_nics)
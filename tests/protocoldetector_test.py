@@ -94,6 +94,21 @@ class Uppercase(Detector):
         return data.upper()
 
 
+class Nodelay(Detector):
+    """ A detector replying with the TCP_NODELAY option of the socket """
+
+    NAME = "nodelay"
+    REQUIRED_SIZE = len(NAME)
+
+    def handle_socket(self, client_socket, socket_address):
+        self.nodelay = client_socket.getsockopt(socket.IPPROTO_TCP,
+                                                socket.TCP_NODELAY)
+        super(Nodelay, self).handle_socket(client_socket, socket_address)
+
+    def response(self, data):
+        return "%d\n" % self.nodelay
+
+
 @expandPermutations
 class AcceptorTests(VdsmTestCase):
 
@@ -150,6 +165,11 @@ class AcceptorTests(VdsmTestCase):
         data = "uppercase testing is fun\n"
         self.check_detect(use_ssl, data, data.upper())
 
+    @permutations(PERMUTATIONS)
+    def test_accepted_socket_nodelay(self, use_ssl):
+        self.start_acceptor(use_ssl)
+        self.check_detect(use_ssl, "nodelay testing is fun\n", "1\n")
+
     @permutations(PERMUTATIONS)
     def test_detect_concurrency(self, use_ssl):
         self.start_acceptor(use_ssl)
@@ -223,6 +243,7 @@ class AcceptorTests(VdsmTestCase):
         self.acceptor.TIMEOUT = 1
         self.acceptor.add_detector(Echo())
         self.acceptor.add_detector(Uppercase())
+        self.acceptor.add_detector(Nodelay())
         self.acceptor_address = \
             self.acceptor._acceptor.socket.getsockname()[0:2]
         t = threading.Thread(target=self.reactor.process_requests)
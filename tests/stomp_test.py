@@ -20,18 +20,22 @@
 
 from __future__ import absolute_import
 from __future__ import division
+
+from contextlib import contextmanager
+import itertools
+
 from six.moves import queue
-from uuid import uuid4
 
 from testlib import VdsmTestCase as TestCaseBase, \
     expandPermutations, \
     permutations, \
     dummyTextGenerator
 
-from testValidation import broken_on_ci
+from testValidation import broken_on_ci, stresstest
 
 import yajsonrpc
 from integration.jsonRpcHelper import constructAcceptor
+from yajsonrpc import JsonRpcRequest
 from yajsonrpc.stompclient import StandAloneRpcClient
 from vdsm import utils
 
@@ -39,8 +43,26 @@ from integration.sslhelper import DEAFAULT_SSL_CONTEXT
 
 
 CALL_TIMEOUT = 15
+_PIPELINED_CALLS = 32
+_BULK_ECHO_COUNT = 8
 _USE_SSL = [[True], [False]]
 
+_ids = itertools.count()
+_payloads = {}
+
+
+def _uid():
+    # Ids only need to be unique within this process.
+    return 'test-%x' % next(_ids)
+
+
+def _payload(size):
+    # The payload depends only on the size, so build it once per size and
+    # share it between the ssl and non ssl permutations.
+    if size not in _payloads:
+        _payloads[size] = dummyTextGenerator(size)
+    return _payloads[size]
+
 
 class Schema(object):
 
@@ -52,9 +74,21 @@ class _SampleBridge(object):
     cif = None
     event_schema = Schema()
 
+    def __init__(self):
+        self._methods = {
+            'echo': self.echo,
+            'bulk_echo': self.bulk_echo,
+            'event': self.event,
+            'register_server_address': self.register_server_address,
+            'unregister_server_address': self.unregister_server_address,
+        }
+
     def echo(self, text):
         return text
 
+    def bulk_echo(self, texts):
+        return list(texts)
+
     def event(self):
         self.cif.notify('vdsm.event', {'content': True})
 
@@ -66,8 +100,8 @@ class _SampleBridge(object):
 
     def dispatch(self, method):
         try:
-            return getattr(self, method)
-        except AttributeError:
+            return self._methods[method]
+        except KeyError:
             raise yajsonrpc.JsonRpcMethodNotFoundError(method=method)
 
 
@@ -77,28 +111,73 @@ class StompTests(TestCaseBase):
     @broken_on_ci(
         "Fails randomly in oVirt CI, see https://gerrit.ovirt.org/c/95899/")
     @permutations([
-        # size, use_ssl
-        (1024, True),
-        (1024, False),
-        (4096, True),
-        (4096, False),
-        (16384, True),
-        (16384, False),
+        # use_ssl, sizes
+        # TLS overhead does not depend on the payload size, so cover ssl
+        # with a single size and sweep the sizes over plain connections.
+        (True, (4096,)),
+        (False, (1024, 4096)),
     ])
-    def test_echo(self, size, use_ssl):
-        data = dummyTextGenerator(size)
+    def test_echo(self, use_ssl, sizes):
+        self._check_echo(use_ssl, sizes)
+
+    @broken_on_ci(
+        "Fails randomly in oVirt CI, see https://gerrit.ovirt.org/c/95899/")
+    @stresstest
+    def test_echo_large(self):
+        self._check_echo(False, (16384,))
+
+    def _check_echo(self, use_ssl, sizes):
+        with self._client(use_ssl) as client:
+            for size in sizes:
+                data = _payload(size)
+                result = client.callMethod('echo', (data,), _uid())
+                self._assert_echoed(result, data)
+
+    @broken_on_ci(
+        "Fails randomly in oVirt CI, see https://gerrit.ovirt.org/c/95899/")
+    @permutations(_USE_SSL)
+    def test_echo_pipelined(self, use_ssl):
+        data = _payload(4096)
+        with self._client(use_ssl) as client:
+            # Send all the requests before waiting for the first response.
+            calls = [
+                client.call_async(None,
+                                  JsonRpcRequest('echo', (data,), _uid()))
+                for _ in range(_PIPELINED_CALLS)
+            ]
+            for call in calls:
+                self.assertTrue(call.wait(CALL_TIMEOUT))
+                response = call.responses[0]
+                self.assertIsNone(response.error)
+                self._assert_echoed(response.result, data)
 
+    @broken_on_ci(
+        "Fails randomly in oVirt CI, see https://gerrit.ovirt.org/c/95899/")
+    @permutations(_USE_SSL)
+    def test_bulk_echo(self, use_ssl):
+        texts = [_payload(4096)] * _BULK_ECHO_COUNT
+        with self._client(use_ssl) as client:
+            result = client.callMethod('bulk_echo', (texts,), _uid())
+        self.assertEqual(len(result), len(texts))
+        for echoed, data in zip(result, texts):
+            self._assert_echoed(echoed, data)
+
+    @contextmanager
+    def _client(self, use_ssl):
         with constructAcceptor(self.log, use_ssl, _SampleBridge()) as acceptor:
             sslctx = DEAFAULT_SSL_CONTEXT if use_ssl else None
-
             with utils.closing(StandAloneRpcClient(acceptor._host,
                                                    acceptor._port,
                                                    'jms.topic.vdsm_requests',
-                                                   str(uuid4()),
+                                                   _uid(),
                                                    sslctx, False)) as client:
-                self.assertEqual(client.callMethod('echo', (data,),
-                                                   str(uuid4())),
-                                 data)
+                yield client
+
+    def _assert_echoed(self, result, data):
+        # Check the length first; a mismatch in a large payload fails with a
+        # short message instead of a diff of the whole text.
+        self.assertEqual(len(result), len(data))
+        self.assertEqual(result, data)
 
     @broken_on_ci(
         "Fails randomly in oVirt CI, see https://gerrit.ovirt.org/c/95899/")
@@ -117,7 +196,7 @@ class StompTests(TestCaseBase):
                 custom_topic = 'jms.queue.events'
                 client.subscribe(custom_topic, event_queue)
 
-                client.callMethod("event", [], str(uuid4()))
+                client.callMethod("event", [], _uid())
 
                 try:
                     event, event_params = event_queue.get(timeout=CALL_TIMEOUT)
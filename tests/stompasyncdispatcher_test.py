@@ -39,6 +39,14 @@ from yajsonrpc.stomp import (
 
 class AsyncDispatcherTest(TestCaseBase):
 
+    _HEADERS = {Headers.CONTENT_LENGTH: '78',
+                Headers.DESTINATION: 'jms.topic.vdsm_responses',
+                Headers.CONTENT_TYPE: 'application/json',
+                Headers.SUBSCRIPTION: 'ad052acb-a934-4e10-8ec3-00c7417ef8d'}
+    _BODY = ('{"jsonrpc": "2.0", "id": "e8a936a6-d886-4cfa-97b9-2d54209053f'
+             'f", "result": []}')
+    _FRAME = Frame(command=Command.MESSAGE, headers=_HEADERS, body=_BODY)
+
     def test_handle_connect(self):
         frame_handler = FakeFrameHandler()
         dispatcher = AsyncDispatcher(FakeConnection(), frame_handler)
@@ -49,20 +57,14 @@ class AsyncDispatcherTest(TestCaseBase):
 
     def test_handle_read(self):
         frame_handler = FakeFrameHandler()
-        headers = {Headers.CONTENT_LENGTH: '78',
-                   Headers.DESTINATION: 'jms.topic.vdsm_responses',
-                   Headers.CONTENT_TYPE: 'application/json',
-                   Headers.SUBSCRIPTION: 'ad052acb-a934-4e10-8ec3-00c7417ef8d'}
-        body = ('{"jsonrpc": "2.0", "id": "e8a936a6-d886-4cfa-97b9-2d54209053f'
-                'f", "result": []}')
-        frame = Frame(command=Command.MESSAGE, headers=headers, body=body)
         dispatcher = AsyncDispatcher(FakeConnection(), frame_handler)
-        dispatcher.handle_read(FakeAsyncDispatcher(None, data=frame.encode()))
+        data = self._FRAME.encode()
+        dispatcher.handle_read(FakeAsyncDispatcher(None, data=data))
 
         self.assertTrue(frame_handler.has_outgoing_messages)
         recv_frame = frame_handler.pop_message()
         self.assertEqual(Command.MESSAGE, recv_frame.command)
-        self.assertEqual(body, recv_frame.body)
+        self.assertEqual(self._BODY, recv_frame.body)
 
     def test_handle_error(self):
         frame_handler = FakeFrameHandler()
@@ -121,15 +123,8 @@ class AsyncDispatcherTest(TestCaseBase):
         self.assertEqual(dispatcher.next_check_interval(), DEFAULT_INTERVAL)
 
     def test_handle_write(self):
-        headers = {Headers.CONTENT_LENGTH: '78',
-                   Headers.DESTINATION: 'jms.topic.vdsm_responses',
-                   Headers.CONTENT_TYPE: 'application/json',
-                   Headers.SUBSCRIPTION: 'ad052acb-a934-4e10-8ec3-00c7417ef8d'}
-        body = ('{"jsonrpc": "2.0", "id": "e8a936a6-d886-4cfa-97b9-2d54209053f'
-                'f", "result": []}')
-        frame = Frame(command=Command.MESSAGE, headers=headers, body=body)
         frame_handler = FakeFrameHandler()
-        frame_handler.handle_frame(None, frame)
+        frame_handler.handle_frame(None, self._FRAME)
 
         dispatcher = AsyncDispatcher(FakeConnection(), frame_handler)
         self.assertTrue(dispatcher.writable(None))
@@ -95,6 +95,7 @@ def make_env(env_type, base, top):
         prealloc = sc.SPARSE_VOL
 
     with fake_env(env_type) as env:
+        sd_id = env.sd_manifest.sdUUID
         env.make_volume(base.virtual * GB, img_id, base_id,
                         vol_format=sc.name2type(base.format),
                         prealloc=prealloc)
@@ -102,15 +103,13 @@ def make_env(env_type, base, top):
                         parent_vol_id=base_id,
                         vol_format=sc.COW_FORMAT)
         env.subchain = merge.SubchainInfo(
-            dict(sd_id=env.sd_manifest.sdUUID, img_id=img_id,
+            dict(sd_id=sd_id, img_id=img_id,
                  base_id=base_id, top_id=top_id), 0)
 
         if env_type == 'block':
             # Simulate allocation by adjusting the LV sizes
-            env.lvm.extendLV(env.sd_manifest.sdUUID, base_id,
-                             base.physical * GB // MB)
-            env.lvm.extendLV(env.sd_manifest.sdUUID, top_id,
-                             top.physical * GB // MB)
+            env.lvm.extendLV(sd_id, base_id, base.physical * GB // MB)
+            env.lvm.extendLV(sd_id, top_id, top.physical * GB // MB)
 
         with MonkeyPatch().context() as mp:
             mp.setattr(guarded, 'context', fake_guarded_context())
@@ -136,10 +135,31 @@ class FakeImage(object):
         pass
 
 
+class FakeCreateOperation(object):
+    """
+    Replaces qemuimg.create in tests that use only the volume metadata, so
+    no qcow2 images are created.
+    """
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def run(self):
+        pass
+
+
 @xfail_python3
 class TestSubchainInfo:
 
-    # TODO: use one make_env for all tests?
+    @pytest.fixture(scope="class")
+    def chain_env(self):
+        """
+        Environment with a chain of 3 volumes, shared by the tests that do not
+        modify the chain.
+        """
+        with self.make_env(chain_len=3) as env:
+            yield env
+
     @contextmanager
     def make_env(self, sd_type='file', format='raw', chain_len=2,
                  shared=False):
@@ -150,69 +170,67 @@ class TestSubchainInfo:
                 mp.setattr(guarded, 'context', fake_guarded_context())
                 mp.setattr(merge, 'sdCache', env.sdcache)
                 mp.setattr(blockVolume, 'rm', FakeResourceManager())
+                # Validating a subchain checks only the volume metadata.
+                mp.setattr(qemuimg, 'create', FakeCreateOperation)
 
                 env.chain = make_qemu_chain(env, size, base_fmt, chain_len)
 
                 def fake_chain(self, sdUUID, imgUUID, volUUID=None):
                     return env.chain
 
-                image.Image.getChain = fake_chain
+                mp.setattr(image.Image, 'getChain', fake_chain)
 
                 yield env
 
-    def test_legal_chain(self):
-        with self.make_env() as env:
-            base_vol = env.chain[0]
-            top_vol = env.chain[1]
-            subchain_info = dict(sd_id=base_vol.sdUUID,
-                                 img_id=base_vol.imgUUID,
-                                 base_id=base_vol.volUUID,
-                                 top_id=top_vol.volUUID,
-                                 base_generation=0)
-
-            subchain = merge.SubchainInfo(subchain_info, 0)
-            # Next subchain.validate() should pass without exceptions
+    def test_legal_chain(self, chain_env):
+        base_vol = chain_env.chain[0]
+        top_vol = chain_env.chain[1]
+        subchain_info = dict(sd_id=base_vol.sdUUID,
+                             img_id=base_vol.imgUUID,
+                             base_id=base_vol.volUUID,
+                             top_id=top_vol.volUUID,
+                             base_generation=0)
+
+        subchain = merge.SubchainInfo(subchain_info, 0)
+        # Next subchain.validate() should pass without exceptions
+        subchain.validate()
+
+    def test_validate_base_is_not_in_chain(self, chain_env):
+        top_vol = chain_env.chain[1]
+        subchain_info = dict(sd_id=top_vol.sdUUID,
+                             img_id=top_vol.imgUUID,
+                             base_id=make_uuid(),
+                             top_id=top_vol.volUUID,
+                             base_generation=0)
+
+        subchain = merge.SubchainInfo(subchain_info, 0)
+        with pytest.raises(se.VolumeIsNotInChain):
             subchain.validate()
 
-    def test_validate_base_is_not_in_chain(self):
-        with self.make_env() as env:
-            top_vol = env.chain[1]
-            subchain_info = dict(sd_id=top_vol.sdUUID,
-                                 img_id=top_vol.imgUUID,
-                                 base_id=make_uuid(),
-                                 top_id=top_vol.volUUID,
-                                 base_generation=0)
+    def test_validate_top_is_not_in_chain(self, chain_env):
+        base_vol = chain_env.chain[0]
+        subchain_info = dict(sd_id=base_vol.sdUUID,
+                             img_id=base_vol.imgUUID,
+                             base_id=base_vol.volUUID,
+                             top_id=make_uuid(),
+                             base_generation=0)
 
-            subchain = merge.SubchainInfo(subchain_info, 0)
-            with pytest.raises(se.VolumeIsNotInChain):
-                subchain.validate()
-
-    def test_validate_top_is_not_in_chain(self):
-        with self.make_env() as env:
-            base_vol = env.chain[0]
-            subchain_info = dict(sd_id=base_vol.sdUUID,
-                                 img_id=base_vol.imgUUID,
-                                 base_id=base_vol.volUUID,
-                                 top_id=make_uuid(),
-                                 base_generation=0)
-
-            subchain = merge.SubchainInfo(subchain_info, 0)
-            with pytest.raises(se.VolumeIsNotInChain):
-                subchain.validate()
-
-    def test_validate_vol_is_not_base_parent(self):
-        with self.make_env(chain_len=3) as env:
-            base_vol = env.chain[0]
-            top_vol = env.chain[2]
-            subchain_info = dict(sd_id=top_vol.sdUUID,
-                                 img_id=top_vol.imgUUID,
-                                 base_id=base_vol.volUUID,
-                                 top_id=top_vol.volUUID,
-                                 base_generation=0)
+        subchain = merge.SubchainInfo(subchain_info, 0)
+        with pytest.raises(se.VolumeIsNotInChain):
+            subchain.validate()
 
-            subchain = merge.SubchainInfo(subchain_info, 0)
-            with pytest.raises(se.WrongParentVolume):
-                subchain.validate()
+    def test_validate_vol_is_not_base_parent(self, chain_env):
+        base_vol = chain_env.chain[0]
+        top_vol = chain_env.chain[2]
+        subchain_info = dict(sd_id=top_vol.sdUUID,
+                             img_id=top_vol.imgUUID,
+                             base_id=base_vol.volUUID,
+                             top_id=top_vol.volUUID,
+                             base_generation=0)
+
+        subchain = merge.SubchainInfo(subchain_info, 0)
+        with pytest.raises(se.WrongParentVolume):
+            subchain.validate()
 
     @pytest.mark.parametrize("shared_vol", [0, 1])
     def test_validate_vol_is_not_shared(self, shared_vol):
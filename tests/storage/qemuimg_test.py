@@ -25,16 +25,16 @@ import io
 import json
 import os
 import pprint
+import shutil
 from functools import partial
 
 import pytest
 
-from monkeypatch import MonkeyPatch, MonkeyPatchScope
+from monkeypatch import MonkeyPatchScope
 
 from . import qemuio
 
 from testlib import make_config
-from testlib import namedTemporaryDir
 from vdsm.common import cmdutils
 from vdsm.common import commands
 from vdsm.common import constants
@@ -90,38 +90,36 @@ class TestInfo:
             "dirty-flag": False
         }
 
-    def test_info(self):
-        with namedTemporaryDir() as tmpdir:
-            base_path = os.path.join(tmpdir, 'base.img')
-            leaf_path = os.path.join(tmpdir, 'leaf.img')
-            size = 1048576
-            leaf_fmt = qemuimg.FORMAT.QCOW2
-            with MonkeyPatchScope([(qemuimg, 'config', CONFIG)]):
-                op = qemuimg.create(base_path,
-                                    size=size,
-                                    format=qemuimg.FORMAT.RAW)
-                op.run()
-                op = qemuimg.create(leaf_path,
-                                    format=leaf_fmt,
-                                    backing=base_path)
-                op.run()
-
-            info = qemuimg.info(leaf_path)
-            assert leaf_fmt == info['format']
-            assert size == info['virtualsize']
-            assert self.CLUSTER_SIZE == info['clustersize']
-            assert base_path == info['backingfile']
-            assert '0.10' == info['compat']
+    def test_info(self, tmpdir):
+        base_path = str(tmpdir.join('base.img'))
+        leaf_path = str(tmpdir.join('leaf.img'))
+        size = 1048576
+        leaf_fmt = qemuimg.FORMAT.QCOW2
+        with MonkeyPatchScope([(qemuimg, 'config', CONFIG)]):
+            op = qemuimg.create(base_path,
+                                size=size,
+                                format=qemuimg.FORMAT.RAW)
+            op.run()
+            op = qemuimg.create(leaf_path,
+                                format=leaf_fmt,
+                                backing=base_path)
+            op.run()
+
+        info = qemuimg.info(leaf_path)
+        assert leaf_fmt == info['format']
+        assert size == info['virtualsize']
+        assert self.CLUSTER_SIZE == info['clustersize']
+        assert base_path == info['backingfile']
+        assert '0.10' == info['compat']
 
     @pytest.mark.parametrize("unsafe", [True, False])
-    def test_unsafe_info(self, unsafe):
-        with namedTemporaryDir() as tmpdir:
-            img = os.path.join(tmpdir, 'img.img')
-            size = 1048576
-            op = qemuimg.create(img, size=size, format=qemuimg.FORMAT.QCOW2)
-            op.run()
-            info = qemuimg.info(img, unsafe=unsafe)
-            assert size == info['virtualsize']
+    def test_unsafe_info(self, tmpdir, unsafe):
+        img = str(tmpdir.join('img.img'))
+        size = 1048576
+        op = qemuimg.create(img, size=size, format=qemuimg.FORMAT.QCOW2)
+        op.run()
+        info = qemuimg.info(img, unsafe=unsafe)
+        assert size == info['virtualsize']
 
     def test_parse_error(self):
         def call(cmd, **kw):
@@ -174,14 +172,13 @@ class TestInfo:
             info = qemuimg.info('unused')
             assert 'compat' not in info
 
-    def test_untrusted_image(self):
-        with namedTemporaryDir() as tmpdir:
-            img = os.path.join(tmpdir, 'untrusted.img')
-            size = 500 * 1024**3
-            op = qemuimg.create(img, size=size, format=qemuimg.FORMAT.QCOW2)
-            op.run()
-            info = qemuimg.info(img, trusted_image=False)
-            assert size == info['virtualsize']
+    def test_untrusted_image(self, tmpdir):
+        img = str(tmpdir.join('untrusted.img'))
+        size = 500 * 1024**3
+        op = qemuimg.create(img, size=size, format=qemuimg.FORMAT.QCOW2)
+        op.run()
+        info = qemuimg.info(img, trusted_image=False)
+        assert size == info['virtualsize']
 
     def test_untrusted_image_call(self):
         command = []
@@ -217,51 +214,47 @@ class TestCreate:
             allocated = os.stat(image).st_blocks * 512
             assert allocated == allocated_bytes
 
-    def test_no_format(self):
+    def test_no_format(self, tmpdir):
         size = 4096
-        with namedTemporaryDir() as tmpdir:
-            image = os.path.join(tmpdir, "image")
-            op = qemuimg.create(image, size=size)
-            op.run()
+        image = str(tmpdir.join("image"))
+        op = qemuimg.create(image, size=size)
+        op.run()
 
-            info = qemuimg.info(image)
-            assert info['format'] == qemuimg.FORMAT.RAW
-            assert info['virtualsize'] == size
+        info = qemuimg.info(image)
+        assert info['format'] == qemuimg.FORMAT.RAW
+        assert info['virtualsize'] == size
 
-    def test_zero_size(self):
-        with namedTemporaryDir() as tmpdir:
-            image = os.path.join(tmpdir, "image")
-            op = qemuimg.create(image, size=0)
-            op.run()
+    def test_zero_size(self, tmpdir):
+        image = str(tmpdir.join("image"))
+        op = qemuimg.create(image, size=0)
+        op.run()
 
-            info = qemuimg.info(image)
-            assert info['format'] == qemuimg.FORMAT.RAW
-            assert info['virtualsize'] == 0
+        info = qemuimg.info(image)
+        assert info['format'] == qemuimg.FORMAT.RAW
+        assert info['virtualsize'] == 0
 
-    def test_qcow2_compat(self):
-        with namedTemporaryDir() as tmpdir:
-            image = os.path.join(tmpdir, "image")
-            size = 1024 * 1024 * 1024 * 10  # 10 GB
-            op = qemuimg.create(image, format='qcow2', size=size)
-            op.run()
+    def test_qcow2_compat(self, tmpdir):
+        image = str(tmpdir.join("image"))
+        size = 1024 * 1024 * 1024 * 10  # 10 GB
+        op = qemuimg.create(image, format='qcow2', size=size)
+        op.run()
 
-            info = qemuimg.info(image)
-            assert info['format'] == qemuimg.FORMAT.QCOW2
-            assert info['compat'] == "0.10"
-            assert info['virtualsize'] == size
+        info = qemuimg.info(image)
+        assert info['format'] == qemuimg.FORMAT.QCOW2
+        assert info['compat'] == "0.10"
+        assert info['virtualsize'] == size
 
-    def test_qcow2_compat_version3(self):
-        with namedTemporaryDir() as tmpdir:
-            image = os.path.join(tmpdir, "image")
-            size = 1024 * 1024 * 1024 * 10  # 10 GB
-            op = qemuimg.create(image, format='qcow2',
-                                qcow2Compat='1.1', size=size)
-            op.run()
+    def test_qcow2_compat_version3(self, tmpdir):
+        image = str(tmpdir.join("image"))
+        size = 1024 * 1024 * 1024 * 10  # 10 GB
+        op = qemuimg.create(image, format='qcow2',
+                            qcow2Compat='1.1', size=size)
+        op.run()
 
-            info = qemuimg.info(image)
-            assert info['format'] == qemuimg.FORMAT.QCOW2
-            assert info['compat'] == "1.1"
-            assert info['virtualsize'] == size
+        info = qemuimg.info(image)
+        assert info['format'] == qemuimg.FORMAT.QCOW2
+        assert info['compat'] == "1.1"
+        assert info['virtualsize'] == size
 
     def test_qcow2_compat_invalid(self):
         with pytest.raises(ValueError):
@@ -273,14 +266,13 @@ class TestCreate:
             with pytest.raises(exception.InvalidConfiguration):
                 qemuimg.create('image', format='qcow2')
 
-    @MonkeyPatch(qemuimg, 'config', CONFIG)
-    def test_unsafe_create_volume(self):
-        with namedTemporaryDir() as tmpdir:
-            path = os.path.join(tmpdir, 'test.qcow2')
-            # Using unsafe=True to verify that it is possible to create an
-            # image based on a non-existing backing file, like an inactive LV.
-            qemuimg.create(path, size=1048576, format=qemuimg.FORMAT.QCOW2,
-                           backing='no-such-file', unsafe=True)
+    def test_unsafe_create_volume(self, monkeypatch, tmpdir):
+        monkeypatch.setattr(qemuimg, 'config', CONFIG)
+        path = str(tmpdir.join('test.qcow2'))
+        # Using unsafe=True to verify that it is possible to create an
+        # image based on a non-existing backing file, like an inactive LV.
+        qemuimg.create(path, size=1048576, format=qemuimg.FORMAT.QCOW2,
+                       backing='no-such-file', unsafe=True)
 
 
 class TestConvert:
@@ -498,21 +490,21 @@ class TestConvertPreallocation:
         (qemuimg.PREALLOCATION.FALLOC, 10 * 1024**2, 10 * 1024**2),
         (qemuimg.PREALLOCATION.FULL, 10 * 1024**2, 10 * 1024**2),
     ])
-    def test_raw_to_raw(self, preallocation, virtual_size, actual_size):
-        with namedTemporaryDir() as tmpdir:
-            src = os.path.join(tmpdir, 'src')
-            dst = os.path.join(tmpdir, 'dst')
+    def test_raw_to_raw(self, tmpdir, preallocation, virtual_size,
+                        actual_size):
+        src = str(tmpdir.join('src'))
+        dst = str(tmpdir.join('dst'))
 
-            with io.open(src, "wb") as f:
-                f.truncate(virtual_size)
+        with io.open(src, "wb") as f:
+            f.truncate(virtual_size)
 
-            op = qemuimg.convert(src, dst, srcFormat="raw", dstFormat="raw",
-                                 preallocation=preallocation)
-            op.run()
+        op = qemuimg.convert(src, dst, srcFormat="raw", dstFormat="raw",
+                             preallocation=preallocation)
+        op.run()
 
-            stat = os.stat(dst)
-            assert stat.st_size == virtual_size
-            assert stat.st_blocks * 512 == actual_size
+        stat = os.stat(dst)
+        assert stat.st_size == virtual_size
+        assert stat.st_blocks * 512 == actual_size
 
     @pytest.mark.parametrize("preallocation,virtual_size,actual_size", [
         (None, 10 * 1024**2, 0),
@@ -520,21 +512,21 @@ class TestConvertPreallocation:
         (qemuimg.PREALLOCATION.FALLOC, 10 * 1024**2, 10 * 1024**2),
         (qemuimg.PREALLOCATION.FULL, 10 * 1024**2, 10 * 1024**2),
     ])
-    def test_qcow2_to_raw(self, preallocation, virtual_size, actual_size):
-        with namedTemporaryDir() as tmpdir:
-            src = os.path.join(tmpdir, 'src')
-            dst = os.path.join(tmpdir, 'dst')
+    def test_qcow2_to_raw(self, tmpdir, preallocation, virtual_size,
+                          actual_size):
+        src = str(tmpdir.join('src'))
+        dst = str(tmpdir.join('dst'))
 
-            op = qemuimg.create(src, size=virtual_size, format="qcow2")
-            op.run()
+        op = qemuimg.create(src, size=virtual_size, format="qcow2")
+        op.run()
 
-            op = qemuimg.convert(src, dst, srcFormat="qcow2", dstFormat="raw",
-                                 preallocation=preallocation)
-            op.run()
+        op = qemuimg.convert(src, dst, srcFormat="qcow2", dstFormat="raw",
+                             preallocation=preallocation)
+        op.run()
 
-            stat = os.stat(dst)
-            assert stat.st_size == virtual_size
-            assert stat.st_blocks * 512 == actual_size
+        stat = os.stat(dst)
+        assert stat.st_size == virtual_size
+        assert stat.st_blocks * 512 == actual_size
 
     def test_raw_invalid_preallocation(self):
         with pytest.raises(ValueError):
@@ -542,39 +534,37 @@ class TestConvertPreallocation:
                 'src', 'dst', dstFormat="raw",
                 preallocation=qemuimg.PREALLOCATION.METADATA)
 
-    def test_raw_to_qcow2_metadata_prealloc(self):
+    def test_raw_to_qcow2_metadata_prealloc(self, tmpdir):
         virtual_size = 10 * 1024**2
-        with namedTemporaryDir() as tmpdir:
-            src = os.path.join(tmpdir, 'src')
-            dst = os.path.join(tmpdir, 'dst')
+        src = str(tmpdir.join('src'))
+        dst = str(tmpdir.join('dst'))
 
-            op = qemuimg.create(src, size=virtual_size, format="raw")
-            op.run()
+        op = qemuimg.create(src, size=virtual_size, format="raw")
+        op.run()
 
-            op = qemuimg.convert(src, dst, srcFormat="raw", dstFormat="qcow2",
-                                 preallocation=qemuimg.PREALLOCATION.METADATA)
-            op.run()
+        op = qemuimg.convert(src, dst, srcFormat="raw", dstFormat="qcow2",
+                             preallocation=qemuimg.PREALLOCATION.METADATA)
+        op.run()
 
-            actual_size = os.stat(dst).st_size
-            disk_size = qemuimg.info(dst, format="qcow2")["actualsize"]
+        actual_size = os.stat(dst).st_size
+        disk_size = qemuimg.info(dst, format="qcow2")["actualsize"]
 
-            assert actual_size > virtual_size
-            assert disk_size < virtual_size
+        assert actual_size > virtual_size
+        assert disk_size < virtual_size
 
 
 class TestCheck:
 
-    @MonkeyPatch(qemuimg, 'config', CONFIG)
-    def test_check(self):
-        with namedTemporaryDir() as tmpdir:
-            path = os.path.join(tmpdir, 'test.qcow2')
-            op = qemuimg.create(path,
-                                size=1048576,
-                                format=qemuimg.FORMAT.QCOW2)
-            op.run()
-            info = qemuimg.check(path)
-            # The exact value depends on qcow2 internals
-            assert isinstance(info['offset'], int)
+    def test_check(self, monkeypatch, tmpdir):
+        monkeypatch.setattr(qemuimg, 'config', CONFIG)
+        path = str(tmpdir.join('test.qcow2'))
+        op = qemuimg.create(path,
+                            size=1048576,
+                            format=qemuimg.FORMAT.QCOW2)
+        op.run()
+        info = qemuimg.check(path)
+        # The exact value depends on qcow2 internals
+        assert isinstance(info['offset'], int)
 
     def test_offset_no_match(self):
         with MonkeyPatchScope([(commands, "execCmd",
@@ -636,6 +626,15 @@ class TestProgressCommand:
         assert p.progress == 13.0
         assert out == b""
 
+    def test_bulk_progress(self):
+        p = qemuimg.ProgressCommand([])
+        out = bytearray()
+        out += b"".join(b"    (%.2f/100%%)\r" % (i / 100.0)
+                        for i in range(10000))
+        p._update_progress(out)
+        assert p.progress == 99.99
+        assert out == b""
+
     def test_unexpected_output(self):
         p = qemuimg.ProgressCommand([])
         out = bytearray()
@@ -647,6 +646,26 @@ class TestProgressCommand:
         assert p.progress == 42.0
 
 
+@pytest.fixture(scope="class")
+def commit_chains(tmpdir_factory):
+    """
+    Return a function creating the chain of 4 volumes used by TestCommit.
+
+    Creating a chain runs qemu-img and qemu-io 8 times, so we create one chain
+    per qcow2 compat, and each test works on a copy. The volumes use relative
+    backing files, so a copy does not refer to the original chain.
+    """
+    chains = {}
+
+    def get(qcow2_compat):
+        if qcow2_compat not in chains:
+            chains[qcow2_compat] = make_chain(
+                str(tmpdir_factory.mktemp("chain")), qcow2_compat)
+        return chains[qcow2_compat]
+
+    return get
+
+
 class TestCommit:
 
     @pytest.mark.parametrize("qcow2_compat", ["0.10", "1.1"])
@@ -664,62 +683,56 @@ class TestCommit:
         (0, 3, True),
         (0, 3, True),
     ])
-    def test_commit(self, qcow2_compat, base, top, use_base):
+    def test_commit(self, tmpdir, commit_chains, qcow2_compat, base, top,
+                    use_base):
+        template_dir, offsets = commit_chains(qcow2_compat)
+        chain = []
+        for i, orig_offset in enumerate(offsets):
+            name = "vol%d.img" % i
+            vol = str(tmpdir.join(name))
+            shutil.copyfile(os.path.join(template_dir, name), vol)
+            chain.append((vol, orig_offset))
+
+        base_vol = chain[base][0]
+        top_vol = chain[top][0]
+        op = qemuimg.commit(top_vol,
+                            topFormat=qemuimg.FORMAT.QCOW2,
+                            base=base_vol if use_base else None)
+        op.run()
+
+        base_fmt = (qemuimg.FORMAT.RAW if base == 0 else
+                    qemuimg.FORMAT.QCOW2)
+        for i in range(base, top + 1):
+            offset = i * 1024
+            pattern = 0xf0 + i
+            # The base volume must have the data from all the volumes
+            # merged into it.
+            qemuio.verify_pattern(
+                base_vol,
+                base_fmt,
+                offset=offset,
+                len=1024,
+                pattern=pattern)
+
+            if i > base:
+                # internal and top volumes should keep the data, we
+                # may want to wipe this data when deleting the volumes
+                # later.
+                vol, orig_offset = chain[i]
+                actual_offset = qemuimg.check(vol)["offset"]
+                assert actual_offset == orig_offset
+
+    def test_commit_progress(self, tmpdir):
         size = 1048576
-        with namedTemporaryDir() as tmpdir:
-            chain = []
-            parent = None
-            # Create a chain of 4 volumes.
-            for i in range(4):
-                vol = os.path.join(tmpdir, "vol%d.img" % i)
-                format = (qemuimg.FORMAT.RAW if i == 0 else
-                          qemuimg.FORMAT.QCOW2)
-                make_image(vol, size, format, i, qcow2_compat, parent)
-                orig_offset = qemuimg.check(vol)["offset"] if i > 0 else None
-                chain.append((vol, orig_offset))
-                parent = vol
-
-            base_vol = chain[base][0]
-            top_vol = chain[top][0]
-            op = qemuimg.commit(top_vol,
-                                topFormat=qemuimg.FORMAT.QCOW2,
-                                base=base_vol if use_base else None)
-            op.run()
+        base = str(tmpdir.join("base.img"))
+        make_image(base, size, qemuimg.FORMAT.RAW, 0, "1.1")
 
-            base_fmt = (qemuimg.FORMAT.RAW if base == 0 else
-                        qemuimg.FORMAT.QCOW2)
-            for i in range(base, top + 1):
-                offset = i * 1024
-                pattern = 0xf0 + i
-                # The base volume must have the data from all the volumes
-                # merged into it.
-                qemuio.verify_pattern(
-                    base_vol,
-                    base_fmt,
-                    offset=offset,
-                    len=1024,
-                    pattern=pattern)
-
-                if i > base:
-                    # internal and top volumes should keep the data, we
-                    # may want to wipe this data when deleting the volumes
-                    # later.
-                    vol, orig_offset = chain[i]
-                    actual_offset = qemuimg.check(vol)["offset"]
-                    assert actual_offset == orig_offset
-
-    def test_commit_progress(self):
-        with namedTemporaryDir() as tmpdir:
-            size = 1048576
-            base = os.path.join(tmpdir, "base.img")
-            make_image(base, size, qemuimg.FORMAT.RAW, 0, "1.1")
-
-            top = os.path.join(tmpdir, "top.img")
-            make_image(top, size, qemuimg.FORMAT.QCOW2, 1, "1.1", base)
-
-            op = qemuimg.commit(top, topFormat=qemuimg.FORMAT.QCOW2)
-            op.run()
-            assert 100 == op.progress
+        top = str(tmpdir.join("top.img"))
+        make_image(top, size, qemuimg.FORMAT.QCOW2, 1, "1.1", base)
+
+        op = qemuimg.commit(top, topFormat=qemuimg.FORMAT.QCOW2)
+        op.run()
+        assert 100 == op.progress
 
 
 class TestMap:
@@ -732,71 +745,70 @@ class TestMap:
     FORMAT = qemuimg.FORMAT.QCOW2
 
     @pytest.mark.parametrize("qcow2_compat", ["0.10", "1.1"])
-    def test_empty_image(self, qcow2_compat):
-        with namedTemporaryDir() as tmpdir:
-            size = 1048576
-            image = os.path.join(tmpdir, "base.img")
-            op = qemuimg.create(image, size=size, format=self.FORMAT,
-                                qcow2Compat=qcow2_compat)
-            op.run()
+    def test_empty_image(self, tmpdir, qcow2_compat):
+        size = 1048576
+        image = str(tmpdir.join("base.img"))
+        op = qemuimg.create(image, size=size, format=self.FORMAT,
+                            qcow2Compat=qcow2_compat)
+        op.run()
 
-            expected = [
-                # single run - empty
-                {
-                    "start": 0,
-                    "length": size,
-                    "data": False,
-                    "zero": True,
-                },
-            ]
+        expected = [
+            # single run - empty
+            {
+                "start": 0,
+                "length": size,
+                "data": False,
+                "zero": True,
+            },
+        ]
 
-            self.check_map(qemuimg.map(image), expected)
+        self.check_map(qemuimg.map(image), expected)
 
     @pytest.mark.parametrize("qcow2_compat", ["0.10", "1.1"])
     @pytest.mark.parametrize("offset,length,expected_length", [
         (64 * 1024, 4 * 1024, 65536),
         (64 * 1024, 72 * 1024, 131072),
     ])
-    def test_one_block(self, offset, length, expected_length, qcow2_compat):
-        with namedTemporaryDir() as tmpdir:
-            size = 1048576
-            image = os.path.join(tmpdir, "base.img")
-            op = qemuimg.create(image, size=size, format=self.FORMAT,
-                                qcow2Compat=qcow2_compat)
-            op.run()
+    def test_one_block(self, tmpdir, offset, length, expected_length,
+                       qcow2_compat):
+        size = 1048576
+        image = str(tmpdir.join("base.img"))
+        op = qemuimg.create(image, size=size, format=self.FORMAT,
+                            qcow2Compat=qcow2_compat)
+        op.run()
 
-            qemuio.write_pattern(
-                image,
-                self.FORMAT,
-                offset=offset,
-                len=length,
-                pattern=0xf0)
-
-            expected = [
-                # run 1 - empty
-                {
-                    "start": 0,
-                    "length": offset,
-                    "data": False,
-                    "zero": True,
-                },
-                # run 2 - data
-                {
-                    "start": offset,
-                    "length": expected_length,
-                    "data": True,
-                    "zero": False,
-                },
-                # run 3 - empty
-                {
-                    "start": offset + expected_length,
-                    "length": size - offset - expected_length,
-                    "data": False,
-                    "zero": True,
-                },
-            ]
-
-            self.check_map(qemuimg.map(image), expected)
+        qemuio.write_pattern(
+            image,
+            self.FORMAT,
+            offset=offset,
+            len=length,
+            pattern=0xf0)
+
+        expected = [
+            # run 1 - empty
+            {
+                "start": 0,
+                "length": offset,
+                "data": False,
+                "zero": True,
+            },
+            # run 2 - data
+            {
+                "start": offset,
+                "length": expected_length,
+                "data": True,
+                "zero": False,
+            },
+            # run 3 - empty
+            {
+                "start": offset + expected_length,
+                "length": size - offset - expected_length,
+                "data": False,
+                "zero": True,
+            },
+        ]
+
+        self.check_map(qemuimg.map(image), expected)
 
     def check_map(self, actual, expected):
         if len(expected) != len(actual):
@@ -818,20 +830,20 @@ class TestAmend:
         ("0.10", "0.10"),
         ("1.1", "1.1"),
     ])
-    def test_empty_image(self, monkeypatch, qcow2_compat, desired_compat):
+    def test_empty_image(self, tmpdir, monkeypatch, qcow2_compat,
+                         desired_compat):
         monkeypatch.setattr(qemuimg, 'config', CONFIG)
-        with namedTemporaryDir() as tmpdir:
-            base_path = os.path.join(tmpdir, 'base.img')
-            leaf_path = os.path.join(tmpdir, 'leaf.img')
-            size = 1048576
-            op_base = qemuimg.create(base_path, size=size,
-                                     format=qemuimg.FORMAT.RAW)
-            op_base.run()
-            op_leaf = qemuimg.create(leaf_path, format=qemuimg.FORMAT.QCOW2,
-                                     backing=base_path)
-            op_leaf.run()
-            qemuimg.amend(leaf_path, desired_compat)
-            assert qemuimg.info(leaf_path)['compat'] == desired_compat
+        base_path = str(tmpdir.join('base.img'))
+        leaf_path = str(tmpdir.join('leaf.img'))
+        size = 1048576
+        op_base = qemuimg.create(base_path, size=size,
+                                 format=qemuimg.FORMAT.RAW)
+        op_base.run()
+        op_leaf = qemuimg.create(leaf_path, format=qemuimg.FORMAT.QCOW2,
+                                 backing=base_path)
+        op_leaf.run()
+        qemuimg.amend(leaf_path, desired_compat)
+        assert qemuimg.info(leaf_path)['compat'] == desired_compat
 
 
 class TestMeasure:
@@ -944,6 +956,26 @@ def convert_to_qcow2(src, compressed=False, compat="1.1"):
     return dst
 
 
+def make_chain(tmpdir, qcow2_compat):
+    """
+    Create a chain of 4 volumes (vol0.img <- vol1.img <- vol2.img <- vol3.img)
+    in tmpdir, and return the directory and the qcow2 check offset of each
+    volume (None for the raw base volume).
+    """
+    size = 1048576
+    offsets = []
+    parent = None
+    for i in range(4):
+        name = "vol%d.img" % i
+        vol = os.path.join(tmpdir, name)
+        format = (qemuimg.FORMAT.RAW if i == 0 else
+                  qemuimg.FORMAT.QCOW2)
+        make_image(vol, size, format, i, qcow2_compat, parent)
+        offsets.append(qemuimg.check(vol)["offset"] if i > 0 else None)
+        parent = name
+    return tmpdir, offsets
+
+
 def make_image(path, size, format, index, qcow2_compat, backing=None):
     op = qemuimg.create(path, size=size, format=format,
                         qcow2Compat=qcow2_compat,
@@ -27,6 +27,7 @@ import logging
 import os
 import os.path
 import signal
+import socket
 import sys
 import time
 import timeit
@@ -46,7 +47,7 @@ from fakelib import FakeLogger
 from testlib import forked, online_cpus
 from testlib import permutations, expandPermutations
 from testlib import VdsmTestCase as TestCaseBase
-from testValidation import brokentest
+from testValidation import brokentest, stresstest
 
 EXT_SLEEP = "sleep"
 
@@ -278,7 +279,7 @@ class TestGetCmdArgs(TestCaseBase):
         try:
             test = lambda: self.assertEqual(utils.getCmdArgs(sproc.pid),
                                             tuple())
-            function.retry(AssertionError, test, tries=10, sleep=0.1)
+            function.retry(test, AssertionError, tries=10, sleep=0.1)
         finally:
             sproc.wait()
 
@@ -326,6 +327,11 @@ class TestGeneralUtils(TestCaseBase):
 
 
 class TestCallbackChain(TestCaseBase):
+    def _run(self, chain):
+        # Thread.run() executes the chain in the calling thread; starting a
+        # thread per test adds nothing to what is being checked here.
+        chain.run()
+
     def testCanPassIterableOfCallbacks(self):
         f = lambda: False
         callbacks = [f] * 10
@@ -348,8 +354,7 @@ class TestCallbackChain(TestCaseBase):
             return False
 
         chain = utils.CallbackChain([callback] * n)
-        chain.start()
-        chain.join()
+        self._run(chain)
         self.assertEqual(counter[0], 0)
 
     def testChainStopsAfterSuccessfulCallback(self):
@@ -361,8 +366,7 @@ class TestCallbackChain(TestCaseBase):
             return counter[0] == 5
 
         chain = utils.CallbackChain([callback] * n)
-        chain.start()
-        chain.join()
+        self._run(chain)
         self.assertEqual(counter[0], 5)
 
     def testArgsPassedToCallback(self):
@@ -375,8 +379,7 @@ class TestCallbackChain(TestCaseBase):
 
         chain = utils.CallbackChain()
         chain.addCallback(callback, *callbackArgs, **callbackKwargs)
-        chain.start()
-        chain.join()
+        self._run(chain)
 
 
 class TestTraceback(TestCaseBase):
@@ -537,6 +540,7 @@ class TestPickleCopy(TestCaseBase):
         self.assertEqual(utils.picklecopy(VM_STATUS_DUMP),
                          copy.deepcopy(VM_STATUS_DUMP))
 
+    @stresstest
     def test_picklecopy_faster(self):
         setup = """
 import copy
@@ -627,3 +631,18 @@ class TestStopwatch(TestCaseBase):
         with utils.stopwatch("message", level=logging.INFO, log=log):
             pass
         self.assertNotEqual(log.messages, [])
+
+
+class TestCreateConnectedSocket(TestCaseBase):
+
+    def test_tcp_nodelay(self):
+        server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        with utils.closing(server):
+            server.bind(("127.0.0.1", 0))
+            server.listen(1)
+            host, port = server.getsockname()
+            client = utils.create_connected_socket(host, port)
+            with utils.closing(client):
+                nodelay = client.getsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_NODELAY)
+                self.assertNotEqual(nodelay, 0)
@@ -247,7 +247,7 @@ class MockVirConnect(object):
         return self._type
 
     def listAllDomains(self):
-        return [vm for vm in self._vms]
+        return list(self._vms)
 
     def listDefinedDomains(self):
         # listDefinedDomains return only inactive domains
@@ -22,9 +22,7 @@ from __future__ import division
 
 from contextlib import contextmanager
 import io
-import subprocess
 import tarfile
-import time
 import uuid
 import zipfile
 
@@ -39,6 +37,7 @@ from vdsm.common import libvirtconnection
 from vdsm.common import response
 from vdsm.common.cmdutils import CommandPath
 from vdsm.common.commands import execCmd, terminating
+from vdsm.common.compat import subprocess
 from vdsm.common.password import ProtectedPassword
 
 from testlib import VdsmTestCase as TestCaseBase, recorded
@@ -536,9 +535,6 @@ class v2vTests(TestCaseBase):
         self.assertEqual('1.1', cmd._base_command[i + 1])
 
 
-SHORT_SLEEP = 0.3
-
-
 @expandPermutations
 class PipelineProcTests(TestCaseBase):
 
@@ -581,51 +577,70 @@ class PipelineProcTests(TestCaseBase):
                 self.assertEqual(p.returncode, returncode)
 
     @permutations([
-        # (cmd1, cmd2)
-        [['sleep', str(3 * SHORT_SLEEP)], ['sleep', str(SHORT_SLEEP)]],
-        [['sleep', str(SHORT_SLEEP)], ['sleep', str(3 * SHORT_SLEEP)]],
-        [['sleep', str(3 * SHORT_SLEEP)], ['sleep', str(3 * SHORT_SLEEP)]],
+        # (runtime1, runtime2)
+        [3, 1],
+        [1, 3],
+        [3, 3],
     ])
-    def testWait(self, cmd1, cmd2):
-        p1 = v2v._simple_exec_cmd(cmd1,
-                                  stdout=subprocess.PIPE)
-        with terminating(p1):
-            p2 = v2v._simple_exec_cmd(cmd2,
-                                      stdin=p1.stdout,
-                                      stdout=subprocess.PIPE)
-            with terminating(p2):
-                p = v2v.PipelineProc(p1, p2)
-                ret = p.wait(2 * SHORT_SLEEP)
-                p.kill()
-                self.assertEqual(ret, False)
+    def testWait(self, runtime1, runtime2):
+        clock = FakeClock()
+        p = v2v.PipelineProc(FakeProc(clock, runtime1),
+                             FakeProc(clock, runtime2))
+        with MonkeyPatchScope([(v2v, 'monotonic_time', clock)]):
+            ret = p.wait(2)
+        self.assertEqual(ret, False)
+        self.assertEqual(clock.now, 2)
 
     def test_wait_on_two_processes_that_finished(self):
-        cmd = ['sleep', str(SHORT_SLEEP)]
-        p1 = v2v._simple_exec_cmd(cmd, stdout=subprocess.PIPE)
-        with terminating(p1):
-            p2 = v2v._simple_exec_cmd(
-                cmd, stdin=p1.stdout, stdout=subprocess.PIPE)
-            with terminating(p2):
-                # Wait for the processes to finish.
-                time.sleep(2 * SHORT_SLEEP)
-                p = v2v.PipelineProc(p1, p2)
-                ret = p.wait(2 * SHORT_SLEEP)
-                p.kill()
-                self.assertEqual(ret, True)
+        clock = FakeClock()
+        p = v2v.PipelineProc(FakeProc(clock, 1), FakeProc(clock, 1))
+        # Wait for the processes to finish.
+        clock.now = 2
+        with MonkeyPatchScope([(v2v, 'monotonic_time', clock)]):
+            ret = p.wait(2)
+        self.assertEqual(ret, True)
+        self.assertEqual(clock.now, 2)
 
     def test_wait_on_two_processes_that_finish_before_timeout(self):
-        cmd1 = ['sleep', str(SHORT_SLEEP)]
-        cmd2 = ['sleep', str(1.5 * SHORT_SLEEP)]
-        p1 = v2v._simple_exec_cmd(cmd1, stdout=subprocess.PIPE)
-        with terminating(p1):
-            p2 = v2v._simple_exec_cmd(
-                cmd2, stdin=p1.stdout, stdout=subprocess.PIPE)
-            with terminating(p2):
-                p = v2v.PipelineProc(p1, p2)
-                # Processes finish at different times but before the timeout.
-                ret = p.wait(3 * SHORT_SLEEP)
-                p.kill()
-                self.assertEqual(ret, True)
+        clock = FakeClock()
+        p = v2v.PipelineProc(FakeProc(clock, 1), FakeProc(clock, 1.5))
+        # Processes finish at different times but before the timeout.
+        with MonkeyPatchScope([(v2v, 'monotonic_time', clock)]):
+            ret = p.wait(3)
+        self.assertEqual(ret, True)
+        self.assertEqual(clock.now, 1.5)
+
+
+class FakeClock(object):
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeProc(object):
+    """
+    Process ending at time runtime on clock. Waiting advances the clock
+    instead of sleeping.
+    """
+
+    pid = 0
+    stdout = None
+
+    def __init__(self, clock, runtime):
+        self._clock = clock
+        self._runtime = runtime
+        self.returncode = None
+
+    def wait(self, timeout=None):
+        if timeout is not None and self._clock.now + timeout < self._runtime:
+            self._clock.now += timeout
+            raise subprocess.TimeoutExpired("fake", timeout)
+        self._clock.now = max(self._clock.now, self._runtime)
+        self.returncode = 0
+        return self.returncode
 
 
 class MockVirConnectTests(TestCaseBase):
@@ -683,6 +698,15 @@ class TestGetOVAInfo(TestCaseBase):
             vm = v2v.get_ova_info(ovapath)
             self.check(vm['vmList'])
 
+    def test_invalid_utf8(self):
+        with self.temporary_ovf_dir() as (base, ovfpath, ovapath):
+            ovf = read_ovf('test').encode('utf-8')
+            with io.open(ovfpath, 'wb') as ovffile:
+                ovffile.write(ovf.replace(b'First', b'\xffirst', 1))
+            with tarfile.open(ovapath, 'w') as tar:
+                tar.add(ovfpath, arcname='testvm.ovf')
+            self.assertRaises(v2v.V2VError, v2v.get_ova_info, ovapath)
+
     @contextmanager
     def temporary_ovf_dir(self):
         with namedTemporaryDir() as base: